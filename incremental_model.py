@@ -0,0 +1,154 @@
+import zlib
+from glob import glob
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import SGDRegressor
+from sklearn.preprocessing import StandardScaler
+
+# Out-of-core training for the early termination model.
+# The per-snapshot data (ndt7_dataset.csv, combined_sec{N}_data.csv) is read in
+# chunks so that memory stays bounded by the chunk size, not by the dataset size.
+
+
+def is_test_session(uuid, test_percent):
+    """
+    Decides whether a session belongs to the hold-out set by hashing its UUID.
+    All snapshots of a session land on the same side, so nothing leaks between
+    train and test, and no list of UUIDs has to be kept in memory.
+
+    Args:
+        uuid (str): Session UUID.
+        test_percent (int): Percentage of sessions to hold out (0-100).
+
+    Returns:
+        bool: True if the session is part of the test split.
+    """
+    return zlib.crc32(str(uuid).encode("utf-8")) % 100 < test_percent
+
+
+def read_chunks(csv_files, features, target, uuid_column="UUID", chunk_size=50000):
+    """
+    Streams the shards chunk by chunk and yields cleaned feature/label arrays.
+
+    Args:
+        csv_files (list): Paths of the per-snapshot CSV shards.
+        features (list): Feature column names.
+        target (str): Label column name.
+        uuid_column (str): Column holding the session UUID.
+        chunk_size (int): Number of rows read at a time.
+
+    Yields:
+        tuple: (feature matrix, label vector, UUID array) for one chunk.
+    """
+    columns = features + [target, uuid_column]
+    for csv_file in csv_files:
+        for chunk in pd.read_csv(csv_file, usecols=columns, chunksize=chunk_size):
+            # combined_sec{N}_data.csv writes missing values as '' and missing labels as "N/A"
+            chunk[target] = pd.to_numeric(chunk[target], errors="coerce")
+            chunk = chunk.dropna(subset=[target, uuid_column])
+            if chunk.empty:
+                continue
+            X = chunk[features].apply(pd.to_numeric, errors="coerce").fillna(0).to_numpy(dtype=np.float64)
+            y = chunk[target].to_numpy(dtype=np.float64)
+            yield X, y, chunk[uuid_column].to_numpy()
+
+
+def split_mask(uuids, test_percent):
+    """Returns a boolean mask marking the rows of a chunk that belong to test sessions."""
+    return np.fromiter((is_test_session(u, test_percent) for u in uuids), dtype=bool, count=len(uuids))
+
+
+def train_incremental(csv_files, target, features=None, uuid_column="UUID",
+                      chunk_size=50000, epochs=5, test_percent=20, random_state=42):
+    """
+    Trains an SGD regressor over sharded per-snapshot data without loading it all.
+
+    The scaler statistics are computed in a single streaming pass over the training
+    sessions, then the model is updated with partial_fit for each epoch, and the
+    hold-out sessions are scored with running sums. Wall time grows linearly with
+    the number of rows (epochs + 2 passes) and peak memory with chunk_size.
+
+    Args:
+        csv_files (list): Paths of the per-snapshot CSV shards.
+        target (str): Label column, e.g. "Escape_Time" or "AverageBandwidth".
+        features (list): Feature columns. Defaults to every column except UUID and target.
+        uuid_column (str): Column holding the session UUID.
+        chunk_size (int): Number of rows read at a time.
+        epochs (int): Number of passes of partial_fit over the training split.
+        test_percent (int): Percentage of sessions held out for evaluation.
+        random_state (int): Seed for the model and the per-chunk shuffling.
+
+    Returns:
+        tuple: (fitted model, fitted scaler, dict of evaluation metrics)
+    """
+    if not csv_files:
+        raise ValueError("No CSV files given for training.")
+
+    if features is None:
+        header = pd.read_csv(csv_files[0], nrows=0).columns
+        features = [c for c in header if c not in (uuid_column, target)]
+
+    def train_chunks():
+        for X, y, uuids in read_chunks(csv_files, features, target, uuid_column, chunk_size):
+            train = ~split_mask(uuids, test_percent)
+            if train.any():
+                yield X[train], y[train]
+
+    # Pass 1: standardization statistics from the training sessions only
+    scaler = StandardScaler()
+    n_train = 0
+    for X, _ in train_chunks():
+        scaler.partial_fit(X)
+        n_train += len(X)
+
+    if n_train == 0:
+        raise ValueError("No training rows found, check the target column and test_percent.")
+
+    # Passes 2..epochs+1: incremental updates
+    # a small step size keeps SGD stable on heavy-tailed counters like BytesAcked
+    model = SGDRegressor(eta0=0.001, random_state=random_state)
+    rng = np.random.default_rng(random_state)
+    for epoch in range(epochs):
+        for X, y in train_chunks():
+            order = rng.permutation(len(y))  # rows of a session are contiguous on disk
+            model.partial_fit(scaler.transform(X[order]), y[order])
+        print(f"Epoch {epoch + 1}/{epochs} done ({n_train} training rows)")
+
+    # Final pass: streaming evaluation on the hold-out sessions
+    n_test, abs_err, sq_err, y_sum, y_sq_sum = 0, 0.0, 0.0, 0.0, 0.0
+    for X, y, uuids in read_chunks(csv_files, features, target, uuid_column, chunk_size):
+        test = split_mask(uuids, test_percent)
+        if not test.any():
+            continue
+        y_true = y[test]
+        y_pred = model.predict(scaler.transform(X[test]))
+        n_test += len(y_true)
+        abs_err += np.abs(y_true - y_pred).sum()
+        sq_err += ((y_true - y_pred) ** 2).sum()
+        y_sum += y_true.sum()
+        y_sq_sum += (y_true ** 2).sum()
+
+    metrics = {"train_rows": n_train, "test_rows": n_test}
+    if n_test:
+        total_var = y_sq_sum - y_sum ** 2 / n_test
+        metrics["MAE"] = abs_err / n_test
+        metrics["RMSE"] = np.sqrt(sq_err / n_test)
+        metrics["R2"] = 1 - sq_err / total_var if total_var > 0 else float("nan")
+
+    return model, scaler, metrics
+
+
+if __name__ == "__main__":
+    # Shards of per-snapshot data; Escape_Time is the early termination label in ndt7_dataset.csv
+    # (use target="AverageBandwidth" for the combined_sec{N}_data.csv files)
+    csv_files = sorted(glob("ndt7_dataset*.csv"))
+    target = "Escape_Time"
+
+    model, scaler, metrics = train_incremental(csv_files, target, chunk_size=50000, epochs=5)
+
+    print(f"Model Performance ({metrics['train_rows']} train rows, {metrics['test_rows']} test rows):")
+    if metrics["test_rows"]:
+        print(f"MAE: {metrics['MAE']:.3f} s")
+        print(f"RMSE: {metrics['RMSE']:.3f} s")
+        print(f"R² Score: {metrics['R2']:.3f}")
@@ -60,3 +60,4 @@ plt.show()
 
 
 # early termination model starts here
+# the per-snapshot data can outgrow memory, see incremental_model.py for out-of-core training